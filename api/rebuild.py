@@ -1,10 +1,12 @@
 """Vercel serverless function to trigger a GitHub Actions rebuild."""
 
-import json
+import hmac
 import os
 from http.server import BaseHTTPRequestHandler
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 UPLOAD_PASSWORD = os.environ.get("UPLOAD_PASSWORD", "")
 GITHUB_PAT = os.environ.get("GITHUB_PAT", "")
@@ -12,6 +14,16 @@ REPO_OWNER = "wyxr-memphis"
 REPO_NAME = "concert-calendar"
 WORKFLOW_FILE = "daily.yml"
 
+# Constant error responses, encoded once at import
+_ERR_INVALID_JSON = orjson.dumps({"error": "Invalid JSON"})
+_ERR_BAD_PASSWORD = orjson.dumps({"error": "Invalid password"})
+
+# Module-level session: Vercel keeps the process warm between invocations, so
+# the keep-alive connection to api.github.com is reused across requests.
+SESSION = requests.Session()
+SESSION.headers.update({"Accept": "application/vnd.github.v3+json"})
+SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+
 
 class handler(BaseHTTPRequestHandler):
     def do_POST(self):
@@ -19,25 +31,24 @@ class handler(BaseHTTPRequestHandler):
         body = self.rfile.read(content_length)
 
         try:
-            data = json.loads(body)
-        except (json.JSONDecodeError, ValueError):
-            return self._json_response(400, {"error": "Invalid JSON"})
+            data = orjson.loads(body)
+        except (orjson.JSONDecodeError, ValueError):
+            return self._json_response(400, _ERR_INVALID_JSON)
 
-        password = data.get("password", "")
-        if not UPLOAD_PASSWORD or password != UPLOAD_PASSWORD:
-            return self._json_response(401, {"error": "Invalid password"})
+        password = str(data.get("password", ""))
+        if not UPLOAD_PASSWORD or not hmac.compare_digest(
+            password.encode("utf-8"), UPLOAD_PASSWORD.encode("utf-8")
+        ):
+            return self._json_response(401, _ERR_BAD_PASSWORD)
 
         # Trigger workflow dispatch
         api_url = (
             f"https://api.github.com/repos/{REPO_OWNER}/{REPO_NAME}"
             f"/actions/workflows/{WORKFLOW_FILE}/dispatches"
         )
-        headers = {
-            "Authorization": f"Bearer {GITHUB_PAT}",
-            "Accept": "application/vnd.github.v3+json",
-        }
+        headers = {"Authorization": f"Bearer {GITHUB_PAT}"}
 
-        resp = requests.post(api_url, headers=headers, json={"ref": "main"})
+        resp = SESSION.post(api_url, headers=headers, json={"ref": "main"})
 
         if resp.status_code == 204:
             return self._json_response(200, {"ok": True})
@@ -53,11 +64,14 @@ class handler(BaseHTTPRequestHandler):
         self.end_headers()
 
     def _json_response(self, status, data):
+        """Send a JSON response; ``data`` may be a dict or pre-encoded bytes."""
+        body = data if isinstance(data, bytes) else orjson.dumps(data)
         self.send_response(status)
         self._send_cors_headers()
         self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
         self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
+        self.wfile.write(body)
 
     def _send_cors_headers(self):
         self.send_header("Access-Control-Allow-Origin", "*")
@@ -1,18 +1,23 @@
 """Vercel serverless function to return the Google Sheet URL."""
 
-import json
 import os
 from http.server import BaseHTTPRequestHandler
 
+import orjson
+
 GOOGLE_SHEET_URL = os.environ.get("GOOGLE_SHEET_URL", "")
 
+# The env var is fixed for the life of a warm container, so the response is
+# encoded once at import rather than on every page load.
+if GOOGLE_SHEET_URL:
+    _STATUS, _BODY = 200, orjson.dumps({"url": GOOGLE_SHEET_URL})
+else:
+    _STATUS, _BODY = 404, orjson.dumps({"error": "Google Sheet URL not configured"})
+
 
 class handler(BaseHTTPRequestHandler):
     def do_GET(self):
-        if GOOGLE_SHEET_URL:
-            self._json_response(200, {"url": GOOGLE_SHEET_URL})
-        else:
-            self._json_response(404, {"error": "Google Sheet URL not configured"})
+        self._json_response(_STATUS, _BODY)
 
     def do_OPTIONS(self):
         self.send_response(200)
@@ -20,11 +25,14 @@ class handler(BaseHTTPRequestHandler):
         self.end_headers()
 
     def _json_response(self, status, data):
+        """Send a JSON response; ``data`` may be a dict or pre-encoded bytes."""
+        body = data if isinstance(data, bytes) else orjson.dumps(data)
         self.send_response(status)
         self._send_cors_headers()
         self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
         self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
+        self.wfile.write(body)
 
     def _send_cors_headers(self):
         self.send_header("Access-Control-Allow-Origin", "*")
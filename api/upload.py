@@ -1,10 +1,14 @@
 """Vercel serverless function for uploading artifacts to GitHub."""
 
 import base64
-import json
+import hmac
+import io
 import os
 from http.server import BaseHTTPRequestHandler
+
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 REPO_OWNER = "wyxr-memphis"
 REPO_NAME = "concert-calendar"
@@ -15,6 +19,24 @@ ALLOWED_EXTENSIONS = {
     ".mhtml", ".html", ".htm",
 }
 MAX_FILE_SIZE = 20 * 1024 * 1024  # 20 MB
+MAX_FIELD_SIZE = 64 * 1024  # Non-file form fields (password, etc.)
+MAX_HEADER_SIZE = 8 * 1024  # Per-part header block
+STREAM_CHUNK_SIZE = 32 * 1024
+
+# Constant error responses, encoded once at import
+_ERR_NOT_MULTIPART = orjson.dumps({"error": "Expected multipart/form-data"})
+_ERR_NO_BOUNDARY = orjson.dumps({"error": "Missing boundary"})
+_ERR_TOO_LARGE = orjson.dumps({"error": "File too large (max 20 MB)"})
+_ERR_BAD_PASSWORD = orjson.dumps({"error": "Invalid password"})
+_ERR_MALFORMED = orjson.dumps({"error": "Malformed multipart body"})
+_ERR_NO_FILE = orjson.dumps({"error": "No file provided"})
+_ERR_BAD_FILENAME = orjson.dumps({"error": "Invalid filename"})
+
+# Module-level session: Vercel keeps the process warm between invocations, so
+# the keep-alive connection to api.github.com is reused across requests.
+SESSION = requests.Session()
+SESSION.headers.update({"Accept": "application/vnd.github.v3+json"})
+SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
 
 
 class handler(BaseHTTPRequestHandler):
@@ -25,32 +47,52 @@ class handler(BaseHTTPRequestHandler):
         content_type = self.headers.get("Content-Type", "")
 
         if "multipart/form-data" not in content_type:
-            return self._json_response(400, {"error": "Expected multipart/form-data"})
+            return self._json_response(400, _ERR_NOT_MULTIPART)
 
         # Parse multipart form data
         try:
             boundary = content_type.split("boundary=")[1].strip()
         except (IndexError, AttributeError):
-            return self._json_response(400, {"error": "Missing boundary"})
+            return self._json_response(400, _ERR_NO_BOUNDARY)
 
         content_length = int(self.headers.get("Content-Length", 0))
         if content_length > MAX_FILE_SIZE:
-            return self._json_response(413, {"error": "File too large (max 20 MB)"})
-
-        body = self.rfile.read(content_length)
-        fields = _parse_multipart(body, boundary.encode())
-
-        # Validate password
-        password = fields.get("password", b"").decode("utf-8", errors="replace")
-        if not upload_password or password != upload_password:
-            return self._json_response(401, {"error": "Invalid password"})
-
-        # Get file data
-        file_data = fields.get("file")
-        filename = fields.get("filename", b"").decode("utf-8", errors="replace")
-
-        if not file_data or not filename:
-            return self._json_response(400, {"error": "No file provided"})
+            return self._json_response(413, _ERR_TOO_LARGE)
+
+        # The upload page sends the "password" form field ahead of the file, so
+        # a bad password is rejected before the file streams in. (Not a
+        # header: header values must be Latin-1, which would lock out
+        # passwords with other characters.)
+        if not upload_password:
+            return self._json_response(401, _ERR_BAD_PASSWORD)
+        authorized = False
+
+        # Stream the body through the parser; the file part is base64-encoded
+        # as it arrives, so the raw upload is never held in memory whole.
+        reader = StreamingMultipartReader(self.rfile, boundary.encode(), content_length)
+        file_b64 = None
+        filename = ""
+        try:
+            while (part := reader.read_next_part()) is not None:
+                name, part_filename, data = part
+                if name == "password":
+                    password = data.decode("utf-8", errors="replace")
+                    if not _password_matches(password, upload_password):
+                        return self._json_response(401, _ERR_BAD_PASSWORD)
+                    authorized = True
+                elif name == "file":
+                    file_b64 = data
+                    filename = part_filename or ""
+        except UploadTooLarge:
+            return self._json_response(413, _ERR_TOO_LARGE)
+        except ValueError:
+            return self._json_response(400, _ERR_MALFORMED)
+
+        if not authorized:
+            return self._json_response(401, _ERR_BAD_PASSWORD)
+
+        if not file_b64 or not filename:
+            return self._json_response(400, _ERR_NO_FILE)
 
         # Validate extension
         ext = os.path.splitext(filename)[1].lower()
@@ -64,31 +106,31 @@ class handler(BaseHTTPRequestHandler):
             c for c in filename if c.isalnum() or c in ".-_ "
         ).strip()
         if not safe_filename:
-            return self._json_response(400, {"error": "Invalid filename"})
+            return self._json_response(400, _ERR_BAD_FILENAME)
 
         # Upload to GitHub via Contents API
         github_path = f"{ARTIFACTS_PATH}/{safe_filename}"
         api_url = f"https://api.github.com/repos/{REPO_OWNER}/{REPO_NAME}/contents/{github_path}"
 
-        # Check if file already exists (to get its SHA for update)
-        headers = {
-            "Authorization": f"Bearer {github_pat}",
-            "Accept": "application/vnd.github.v3+json",
-        }
+        # Create optimistically — most uploads are new files, so this is a single
+        # round-trip. If the file already exists GitHub rejects a create without
+        # its SHA (409/422); look the SHA up and retry as an update.
+        headers = {"Authorization": f"Bearer {github_pat}"}
+        put_headers = {**headers, "Content-Type": "application/json"}
 
         sha = None
-        existing = requests.get(api_url, headers=headers)
-        if existing.status_code == 200:
-            sha = existing.json().get("sha")
-
-        put_data = {
-            "message": f"Upload artifact: {safe_filename}",
-            "content": base64.b64encode(file_data).decode("ascii"),
-        }
-        if sha:
-            put_data["sha"] = sha
-
-        resp = requests.put(api_url, headers=headers, json=put_data)
+        resp = SESSION.put(
+            api_url, headers=put_headers, data=_contents_put_body(safe_filename, file_b64)
+        )
+        if resp.status_code in (409, 422):
+            existing = SESSION.get(api_url, headers=headers)
+            if existing.status_code == 200:
+                sha = orjson.loads(existing.content).get("sha")
+                resp = SESSION.put(
+                    api_url,
+                    headers=put_headers,
+                    data=_contents_put_body(safe_filename, file_b64, sha),
+                )
 
         if resp.status_code in (200, 201):
             return self._json_response(200, {
@@ -109,11 +151,14 @@ class handler(BaseHTTPRequestHandler):
         self.end_headers()
 
     def _json_response(self, status, data):
+        """Send a JSON response; ``data`` may be a dict or pre-encoded bytes."""
+        body = data if isinstance(data, bytes) else orjson.dumps(data)
         self.send_response(status)
         self._send_cors_headers()
         self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
         self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
+        self.wfile.write(body)
 
     def _send_cors_headers(self):
         self.send_header("Access-Control-Allow-Origin", "*")
@@ -121,47 +166,164 @@ class handler(BaseHTTPRequestHandler):
         self.send_header("Access-Control-Allow-Headers", "Content-Type")
 
 
-def _parse_multipart(body: bytes, boundary: bytes) -> dict:
-    """Minimal multipart/form-data parser.
+def _contents_put_body(safe_filename: str, content_b64: bytes, sha=None) -> bytes:
+    """Build the Contents API PUT body around the already-encoded base64 blob.
 
-    Returns dict with field names as keys and raw bytes as values.
-    For file fields, also stores 'filename' separately.
+    Assembled by hand so the (up to ~27 MB) base64 content is neither decoded
+    to str nor re-scanned by a JSON encoder. Nothing here needs escaping:
+    safe_filename is limited to alphanumerics and ".-_ ", base64 output is
+    [A-Za-z0-9+/=], and the sha is hex.
     """
-    fields = {}
-    parts = body.split(b"--" + boundary)
-
-    for part in parts:
-        if part in (b"", b"--", b"--\r\n", b"\r\n"):
-            continue
-
-        # Split headers from body
-        if b"\r\n\r\n" not in part:
-            continue
-        header_section, part_body = part.split(b"\r\n\r\n", 1)
-
-        # Strip trailing \r\n from body
-        if part_body.endswith(b"\r\n"):
-            part_body = part_body[:-2]
-
-        header_text = header_section.decode("utf-8", errors="replace")
-
-        # Extract field name
-        name = None
-        filename = None
-        for line in header_text.split("\r\n"):
-            if "Content-Disposition:" in line:
-                for param in line.split(";"):
-                    param = param.strip()
-                    if param.startswith("name="):
-                        name = param.split("=", 1)[1].strip('"')
-                    elif param.startswith("filename="):
-                        filename = param.split("=", 1)[1].strip('"')
-
-        if name == "file":
-            fields["file"] = part_body
-            if filename:
-                fields["filename"] = filename.encode("utf-8")
-        elif name:
-            fields[name] = part_body
-
-    return fields
+    parts = [
+        b'{"message":"Upload artifact: ', safe_filename.encode("utf-8"),
+        b'","content":"', content_b64, b'"',
+    ]
+    if sha:
+        parts += [b',"sha":"', sha.encode("ascii"), b'"']
+    parts.append(b"}")
+    return b"".join(parts)
+
+
+def _password_matches(given: str, expected: str) -> bool:
+    """Constant-time password comparison."""
+    return hmac.compare_digest(given.encode("utf-8"), expected.encode("utf-8"))
+
+
+class UploadTooLarge(ValueError):
+    """A multipart part exceeded its size limit."""
+
+
+class _Base64Writer:
+    """Incremental base64 encoder — buffers at most 2 bytes between writes."""
+
+    def __init__(self):
+        self._out = io.BytesIO()
+        self._pending = b""
+
+    def write(self, data) -> None:
+        data = self._pending + bytes(data)
+        cut = len(data) - len(data) % 3
+        self._out.write(base64.b64encode(data[:cut]))
+        self._pending = data[cut:]
+
+    def getvalue(self) -> bytes:
+        if self._pending:
+            self._out.write(base64.b64encode(self._pending))
+            self._pending = b""
+        return self._out.getvalue()
+
+
+class StreamingMultipartReader:
+    """Minimal streaming multipart/form-data parser.
+
+    Reads the request body in STREAM_CHUNK_SIZE chunks and scans a small
+    sliding window for part delimiters, so only one chunk (plus a partial
+    delimiter) is buffered at a time. Size limits are enforced mid-stream.
+    """
+
+    def __init__(self, stream, boundary: bytes, content_length: int):
+        self._stream = stream
+        self._remaining = content_length
+        self._delim = b"\r\n--" + boundary
+        # Leading CRLF lets the first "--boundary" match the same delimiter
+        self._buf = bytearray(b"\r\n")
+        self._started = False
+        self._done = False
+
+    def read_next_part(self):
+        """Return the next part as (name, filename, data), or None at the end.
+
+        ``data`` is the raw field value as bytes, except for file parts
+        (those with a filename), where it is the base64-encoded file content.
+        """
+        if self._done:
+            return None
+        if not self._started:
+            self._skip_preamble()
+            self._started = True
+
+        # After a delimiter: "--" closes the body, CRLF starts another part
+        while len(self._buf) < 2 and self._fill():
+            pass
+        if len(self._buf) < 2 or self._buf[:2] == b"--":
+            self._done = True
+            return None
+        del self._buf[:2]
+
+        name, filename = _parse_disposition(self._read_headers())
+        if filename:
+            sink, limit = _Base64Writer(), MAX_FILE_SIZE
+        else:
+            sink, limit = io.BytesIO(), MAX_FIELD_SIZE
+        self._read_body(sink, limit)
+        return name, filename, sink.getvalue()
+
+    def _fill(self) -> bool:
+        """Append the next chunk of the body to the buffer."""
+        if self._remaining <= 0:
+            return False
+        chunk = self._stream.read(min(STREAM_CHUNK_SIZE, self._remaining))
+        if not chunk:
+            self._remaining = 0
+            return False
+        self._remaining -= len(chunk)
+        self._buf += chunk
+        return True
+
+    def _skip_preamble(self) -> None:
+        keep = len(self._delim) - 1
+        while True:
+            idx = self._buf.find(self._delim)
+            if idx >= 0:
+                del self._buf[:idx + len(self._delim)]
+                return
+            if len(self._buf) > keep:
+                del self._buf[:len(self._buf) - keep]
+            if not self._fill():
+                raise ValueError("No multipart boundary found")
+
+    def _read_headers(self) -> str:
+        while True:
+            idx = self._buf.find(b"\r\n\r\n")
+            if idx >= 0:
+                header_text = self._buf[:idx].decode("utf-8", errors="replace")
+                del self._buf[:idx + 4]
+                return header_text
+            if len(self._buf) > MAX_HEADER_SIZE:
+                raise ValueError("Part headers too large")
+            if not self._fill():
+                raise ValueError("Truncated part headers")
+
+    def _read_body(self, sink, limit: int) -> None:
+        """Copy the current part's body into ``sink`` up to the next delimiter."""
+        keep = len(self._delim) - 1
+        size = 0
+        while True:
+            idx = self._buf.find(self._delim)
+            end = idx if idx >= 0 else len(self._buf) - keep
+            if end > 0:
+                size += end
+                if size > limit:
+                    raise UploadTooLarge()
+                sink.write(self._buf[:end])
+                del self._buf[:end]
+            if idx >= 0:
+                del self._buf[:len(self._delim)]
+                return
+            if not self._fill():
+                raise ValueError("Truncated multipart body")
+
+
+def _parse_disposition(header_text: str):
+    """Extract (name, filename) from a part's Content-Disposition header."""
+    name = None
+    filename = None
+    for line in header_text.split("\r\n"):
+        if "Content-Disposition:" in line:
+            for param in line.split(";"):
+                param = param.strip()
+                if param.startswith("name="):
+                    name = param.split("=", 1)[1].strip('"')
+                elif param.startswith("filename="):
+                    filename = param.split("=", 1)[1].strip('"')
+    return name, filename
@@ -1,7 +1,17 @@
 """Configuration for Memphis concert calendar."""
 
 import os
+import re
+import sys
 from datetime import date, timedelta
+from functools import lru_cache
+from types import MappingProxyType
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 # ---------------------------------------------------------------------------
 # Date range: today through 7 days out (8 days total)
@@ -153,56 +163,100 @@ MUSIC_KEYWORDS = [
     "karaoke",  # Borderline but keep it — DJs run these
 ]
 
+# Source categories that mark an event as music outright
+MUSIC_CATEGORIES = ["music", "concert", "festivals", "nightlife", "dj"]
+
+
+def _keyword_pattern(keywords):
+    """Compile a keyword list into one alternation (longest keywords first)."""
+    ordered = sorted(keywords, key=len, reverse=True)
+    return re.compile("|".join(re.escape(k) for k in ordered))
+
+
+def _keyword_matcher(keywords):
+    """Return a predicate telling whether text contains any of the keywords.
+
+    Uses an Aho-Corasick automaton (one linear pass over the text) when
+    pyahocorasick is installed, otherwise a compiled regex alternation.
+    """
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+    pattern = _keyword_pattern(keywords)
+    return lambda text: pattern.search(text) is not None
+
+
+# One scan per event instead of one substring scan per keyword
+has_exclude_keyword = _keyword_matcher(EXCLUDE_KEYWORDS)
+has_music_keyword = _keyword_matcher(MUSIC_KEYWORDS)
+has_music_category = _keyword_matcher(MUSIC_CATEGORIES)
+
 # ---------------------------------------------------------------------------
 # Venue name normalization map
 # Maps variations found in API results to canonical names
-# This gets populated from VENUES aliases above at import time
+# This gets populated from VENUES aliases above at import time and frozen
+# behind a read-only proxy. Keys and canonical names are interned so lookups
+# with interned strings and downstream venue comparisons are identity checks.
 # ---------------------------------------------------------------------------
-VENUE_ALIAS_MAP = {}
+_venue_aliases = {}
 for _venue_key, _venue_info in VENUES.items():
-    canonical = _venue_info["name"]
+    canonical = sys.intern(_venue_info["name"])
     for alias in _venue_info.get("aliases", []):
-        VENUE_ALIAS_MAP[alias.lower()] = canonical
+        _venue_aliases[sys.intern(alias.casefold())] = canonical
+VENUE_ALIAS_MAP = MappingProxyType(_venue_aliases)
+
+# Containment match for names that embed an alias ("Live at Hi Tone Cafe"):
+# one scan of the name, longest alias first so "hi tone café" beats "hi tone"
+_ALIAS_RE = _keyword_pattern(VENUE_ALIAS_MAP)
+has_venue_alias = _keyword_matcher(VENUE_ALIAS_MAP)
 
 
+@lru_cache(maxsize=512)
 def normalize_venue_name(name: str) -> str:
-    """Try to match a venue name to our canonical list."""
-    lower = name.lower().strip()
-    if lower in VENUE_ALIAS_MAP:
-        return VENUE_ALIAS_MAP[lower]
-    # Partial match — check if any alias is contained in the name
+    """Try to match a venue name to our canonical list.
+
+    Cached: the same handful of venue strings repeat across every source.
+    """
+    lower = sys.intern(name.strip().casefold())
+    canonical = VENUE_ALIAS_MAP.get(lower)
+    if canonical is not None:
+        return canonical
+    # Partial match — an alias contained in the name...
+    match = _ALIAS_RE.search(lower)
+    if match:
+        return VENUE_ALIAS_MAP[match.group(0)]
+    # ...or the name is a fragment of an alias
     for alias, canonical in VENUE_ALIAS_MAP.items():
-        if alias in lower or lower in alias:
+        if lower in alias:
             return canonical
     # No match found — return original with title case cleanup
-    return name.strip()
+    return sys.intern(name.strip())
 
 
 def is_music_event(title: str, category: str = "", description: str = "") -> bool:
     """Determine if an event is likely a music/DJ event."""
     text = f"{title} {category} {description}".lower()
 
-    # Check exclusions first
-    for keyword in EXCLUDE_KEYWORDS:
-        if keyword in text:
-            # But if it ALSO has strong music indicators, keep it
-            has_music_signal = any(mk in text for mk in MUSIC_KEYWORDS)
-            if not has_music_signal:
-                return False
+    has_music_signal = has_music_keyword(text)
+
+    # Check exclusions first — but if it ALSO has strong music indicators, keep it
+    if not has_music_signal and has_exclude_keyword(text):
+        return False
 
     # If category explicitly says music/concert, include it
-    music_categories = ["music", "concert", "festivals", "nightlife", "dj"]
-    if any(cat in category.lower() for cat in music_categories):
+    if has_music_category(category.lower()):
         return True
 
     # Check for music keywords in title
-    if any(mk in text for mk in MUSIC_KEYWORDS):
+    if has_music_signal:
         return True
 
     # If it's at a known music venue, lean toward including it
-    for alias in VENUE_ALIAS_MAP:
-        if alias in text:
-            return True
+    if has_venue_alias(text):
+        return True
 
     # Default: if we can't tell, exclude to avoid noise
     return False
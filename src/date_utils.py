@@ -1,45 +1,52 @@
 """Shared date parsing utilities."""
 
 import re
-from datetime import datetime, date
-from typing import Optional
+from datetime import datetime, date, time
+from functools import lru_cache
+from typing import Optional, Tuple, Union
 
 from .config import START_DATE
 
+_MONTH_DAY_RE = re.compile(r'(\w{3,9})\s+(\d{1,2})(?:,?\s+(\d{4}))?')
+_DIGIT_RE = re.compile(r'\d')
 
+DATE_FORMATS = (
+    "%b %d, %Y",   # "Feb 12, 2026"
+    "%B %d, %Y",   # "February 12, 2026"
+    "%b %d",        # "Feb 12"
+    "%m/%d/%Y",
+    "%m/%d/%y",
+    "%m-%d-%Y",
+    "%m-%d-%y",
+    "%m.%d.%Y",
+    "%m.%d.%y",
+    "%m.%d",        # Period-separated (e.g., 2.13)
+    "%Y-%m-%d",
+    "%B %d",
+    "%m/%d",
+)
+
+
+@lru_cache(maxsize=2048)
 def parse_date_text(text: str) -> Optional[date]:
     """Try to parse a date string from various formats.
 
     Used by multiple scrapers (bandsintown, memphis_flyer, venue_scrapers, artifacts).
+    Cached: listings repeat the same few date strings, and each miss walks
+    every format below.
     """
-    formats = [
-        "%b %d, %Y",   # "Feb 12, 2026"
-        "%B %d, %Y",   # "February 12, 2026"
-        "%b %d",        # "Feb 12"
-        "%m/%d/%Y",
-        "%m/%d/%y",
-        "%m-%d-%Y",
-        "%m-%d-%y",
-        "%m.%d.%Y",
-        "%m.%d.%y",
-        "%m.%d",        # Period-separated (e.g., 2.13)
-        "%Y-%m-%d",
-        "%B %d",
-        "%m/%d",
-    ]
-
     text = text.strip()
-    for fmt in formats:
-        try:
-            dt = datetime.strptime(text, fmt)
-            if dt.year < 2000:
-                dt = dt.replace(year=START_DATE.year)
-            return dt.date()
-        except ValueError:
-            continue
+    # Every format (and the regex fallback) needs a day number
+    if not _DIGIT_RE.search(text):
+        return None
+    dt = strptime_first(text, DATE_FORMATS)
+    if dt:
+        if dt.year < 2000:
+            dt = dt.replace(year=START_DATE.year)
+        return dt.date()
 
     # Try regex for "Feb 15", "Wed Feb 12", "February 15", etc.
-    match = re.search(r'(\w{3,9})\s+(\d{1,2})(?:,?\s+(\d{4}))?', text)
+    match = _MONTH_DAY_RE.search(text)
     if match:
         month_str, day_str, year_str = match.groups()
         year = int(year_str) if year_str else START_DATE.year
@@ -52,3 +59,61 @@ def parse_date_text(text: str) -> Optional[date]:
                 pass
 
     return None
+
+
+def strptime_first(text: str, formats: Tuple[str, ...]) -> Optional[datetime]:
+    """Parse text with the first format in formats that accepts it.
+
+    Formats that cannot match are skipped without calling strptime (and
+    raising/catching a ValueError): those whose literal separators ("/", "-",
+    ".", ",") are missing from the text, and month-name formats when the text
+    has no letters. The first successful format is the same as trying them all.
+    """
+    chars = set(text)
+    has_alpha = any(c.isalpha() for c in text)
+    for fmt, literals, needs_alpha in _format_guards(formats):
+        if (needs_alpha and not has_alpha) or not literals <= chars:
+            continue
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+@lru_cache(maxsize=None)
+def _format_guards(formats: Tuple[str, ...]):
+    """Precompute (format, required literal chars, needs month name) per format."""
+    return tuple(
+        (fmt, frozenset(re.sub(r"%.", "", fmt)) - {" "}, "%b" in fmt or "%B" in fmt)
+        for fmt in formats
+    )
+
+
+def format_time(value: Union[datetime, time], compact: bool = True) -> str:
+    """Format a clock time as "7:30 PM" ("7 PM" on the hour when compact).
+
+    Portable replacement for strftime("%-I:%M %p") — the %-I flag is
+    glibc-only — that also skips strftime's locale handling.
+    """
+    hour = value.hour % 12 or 12
+    suffix = "AM" if value.hour < 12 else "PM"
+    if compact and value.minute == 0:
+        return f"{hour} {suffix}"
+    return f"{hour}:{value.minute:02d} {suffix}"
+
+
+_WEEKDAYS = ("MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY", "SATURDAY", "SUNDAY")
+_MONTHS = (
+    None, "JANUARY", "FEBRUARY", "MARCH", "APRIL", "MAY", "JUNE",
+    "JULY", "AUGUST", "SEPTEMBER", "OCTOBER", "NOVEMBER", "DECEMBER",
+)
+
+
+def format_day_heading(d: date) -> str:
+    """Format a day heading as "FRIDAY, OCTOBER 17".
+
+    Portable replacement for strftime("%A, %B %-d").upper() — %-d is
+    glibc-only — using fixed name tables instead of locale lookups.
+    """
+    return f"{_WEEKDAYS[d.weekday()]}, {_MONTHS[d.month]} {d.day}"
@@ -0,0 +1,54 @@
+"""HTML parsing helpers.
+
+lxml is a hard dependency (the DICE and Memphis Flyer parsers use it
+directly), so BeautifulSoup is always given lxml's C tree builder, which
+parses the large listing pages several times faster than html.parser.
+JSON-LD blocks can be pulled straight from the raw page without building a
+tree at all.
+"""
+
+import re
+from typing import Iterator
+
+# BeautifulSoup tree builder for the remaining soup-based parsers
+HTML_PARSER = "lxml"
+
+JSONLD_SCRIPT_RE = re.compile(
+    r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+    re.DOTALL | re.IGNORECASE,
+)
+
+
+def iter_jsonld_blocks(html: str) -> Iterator[str]:
+    """Yield the raw contents of each <script type="application/ld+json">."""
+    for match in JSONLD_SCRIPT_RE.finditer(html):
+        yield match.group(1)
+
+
+def iter_event_jsonld_blocks(html: str) -> Iterator[str]:
+    """Like iter_jsonld_blocks, but skip blocks that cannot hold an Event.
+
+    Most pages also embed WebSite/Organization/BreadcrumbList blobs; a
+    substring test is far cheaper than decoding them only to throw them away.
+    """
+    for block in iter_jsonld_blocks(html):
+        if looks_like_event_jsonld(block):
+            yield block
+
+
+def looks_like_event_jsonld(block: str) -> bool:
+    """Cheap pre-check: "Event" and "MusicEvent" types both end in 'Event"'."""
+    return 'Event"' in block
+
+
+def xpath_first(xpath, node):
+    """First match of a compiled lxml XPath under node, or None."""
+    found = xpath(node)
+    return found[0] if found else None
+
+
+def node_text(node) -> str:
+    """Stripped text of an lxml node's subtree (like get_text(strip=True))."""
+    if node is None:
+        return ""
+    return "".join(t.strip() for t in node.itertext())
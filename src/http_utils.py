@@ -0,0 +1,48 @@
+"""Shared HTTP session for source fetchers.
+
+Every source reuses one pooled requests.Session so repeat requests to the same
+host keep their TCP/TLS connection alive instead of re-handshaking each time.
+Transient failures (rate limits, 5xx) are retried with a short backoff, and
+the browser User-Agent the scrapers need is set once here. Brotli is
+advertised only when a decoder is installed for urllib3 to use.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# raise_on_status=False hands back the final response once retries run out,
+# so callers keep seeing the same raise_for_status()/status_code checks.
+RETRY = Retry(
+    total=2,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    raise_on_status=False,
+)
+
+# Sent with every request. Accept prefers HTML for the scrapers but keeps */*
+# so the JSON/CSV endpoints on the same session are unaffected.
+BROWSER_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "text/html,application/xhtml+xml,*/*;q=0.8",
+    "Accept-Encoding": "br, gzip, deflate" if BROTLI_AVAILABLE else "gzip, deflate",
+}
+
+SESSION = requests.Session()
+SESSION.headers.update(BROWSER_HEADERS)
+# pool_connections is the number of per-host pools kept alive; the venue
+# calendars alone span a dozen hosts, so keep room for all sources at once.
+ADAPTER = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=RETRY)
+SESSION.mount("https://", ADAPTER)
+SESSION.mount("http://", ADAPTER)
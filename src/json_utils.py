@@ -0,0 +1,43 @@
+"""JSON helpers — orjson when installed, stdlib json otherwise.
+
+orjson parses UTF-8 bytes directly (no str decode first) and is several
+times faster than the stdlib on API-sized payloads. Its JSONDecodeError
+subclasses json.JSONDecodeError, so callers can keep catching the stdlib one.
+"""
+
+import dataclasses
+import json
+from datetime import date
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def loads(data):
+    """Parse a JSON document from bytes or str."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_pretty(obj) -> bytes:
+    """Serialize to 2-space-indented JSON bytes.
+
+    Dataclasses and dates/datetimes are serialized natively (ISO 8601), so
+    callers can pass model objects without building dicts first.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    if dataclasses.is_dataclass(obj):
+        obj = dataclasses.asdict(obj)
+    return json.dumps(obj, indent=2, default=_json_default).encode("utf-8")
+
+
+def _json_default(value):
+    """Stdlib fallback for the types orjson handles natively."""
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
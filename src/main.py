@@ -9,9 +9,12 @@ Usage:
     python -m src.main --dry-run    # Print results without writing files
 """
 
+import importlib
+import os
 import sys
-import json
+import tempfile
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import List
@@ -19,17 +22,21 @@ from typing import List
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.models import Event, SourceResult
+from src import json_utils
+from src.models import Event, RunLog, SourceResult
 from src.normalize import deduplicate
-from src.generate_html import generate_html
 from src.config import START_DATE, END_DATE
-
-from src.sources import (
-    ticketmaster,
-    google_sheet,
-    venue_scrapers,
-    artifacts,
-)
+from src.date_utils import format_day_heading, format_time
+
+# Source modules are imported on demand inside run() so that importing this
+# module doesn't pull in every scraper's dependencies (requests, bs4,
+# anthropic, PIL) up front. Entries are (display name, module, function).
+SOURCES = [
+    ("Ticketmaster", "src.sources.ticketmaster", "fetch"),
+    ("Google Sheet", "src.sources.google_sheet", "fetch"),
+    ("Artifacts", "src.sources.artifacts", "fetch"),
+]
+VENUE_SCRAPERS_MODULE = "src.sources.venue_scrapers"
 
 # Output paths
 DOCS_DIR = Path(__file__).parent.parent / "docs"
@@ -49,44 +56,24 @@ def run(dry_run: bool = False) -> None:
     all_source_results: List[SourceResult] = []
     all_events: List[Event] = []
 
-    sources = [
-        ("Ticketmaster", ticketmaster.fetch),
-        ("Google Sheet", google_sheet.fetch),
-        ("Artifacts", artifacts.fetch),
-    ]
+    # Every source is network-bound, so fetch them concurrently; results are
+    # still reported in SOURCES order.
+    with ThreadPoolExecutor(max_workers=len(SOURCES) + 1) as executor:
+        source_futures = [executor.submit(_fetch_source, *entry) for entry in SOURCES]
+        venue_future = executor.submit(_fetch_venues)
 
-    for source_name, fetch_fn in sources:
-        print(f"  Fetching: {source_name}...", end=" ", flush=True)
-        try:
-            result = fetch_fn()
+        for (source_name, _, _), future in zip(SOURCES, source_futures):
+            result = future.result()
             all_source_results.append(result)
             all_events.extend(result.events)
-            print(result.status_line)
-        except Exception as e:
-            error_result = SourceResult(
-                source_name=source_name,
-                success=False,
-                error_message=f"Unhandled exception: {str(e)[:100]}",
-            )
-            all_source_results.append(error_result)
-            print(error_result.status_line)
-
-    # Venue scrapers — run individually for better logging
-    print(f"\n  Fetching: Venue Websites...")
-    try:
-        venue_results = venue_scrapers.fetch_individual()
-        for vr in venue_results:
+            print(f"  Fetching: {source_name}... {result.status_line}")
+
+        # Venue scrapers — run individually for better logging
+        print(f"\n  Fetching: Venue Websites...")
+        for vr in venue_future.result():
             all_source_results.append(vr)
             all_events.extend(vr.events)
             print(f"    {vr.status_line}")
-    except Exception as e:
-        error_result = SourceResult(
-            source_name="Venue Websites",
-            success=False,
-            error_message=f"Unhandled exception: {str(e)[:100]}",
-        )
-        all_source_results.append(error_result)
-        print(f"    {error_result.status_line}")
 
     # ---- STEP 2: Deduplicate ----
     print(f"\n  Raw events collected: {len(all_events)}")
@@ -94,6 +81,8 @@ def run(dry_run: bool = False) -> None:
     print(f"  After deduplication: {len(deduped)}")
 
     # ---- STEP 3: Generate HTML ----
+    from src.generate_html import generate_html
+
     html = generate_html(deduped, all_source_results, run_timestamp)
 
     if dry_run:
@@ -106,17 +95,16 @@ def run(dry_run: bool = False) -> None:
     # ---- STEP 4: Write output files ----
     DOCS_DIR.mkdir(parents=True, exist_ok=True)
 
-    with open(INDEX_PATH, "w", encoding="utf-8") as f:
-        f.write(html)
+    _write_atomic(INDEX_PATH, html.encode("utf-8"))
     print(f"\n  ✅ Wrote {INDEX_PATH}")
 
     # Write log
-    log_data = {
-        "run_timestamp": run_timestamp.isoformat(),
-        "date_range": {"start": START_DATE.isoformat(), "end": END_DATE.isoformat()},
-        "total_raw_events": len(all_events),
-        "total_deduped_events": len(deduped),
-        "sources": [
+    run_log = RunLog(
+        run_timestamp=run_timestamp,
+        date_range={"start": START_DATE, "end": END_DATE},
+        total_raw_events=len(all_events),
+        total_deduped_events=len(deduped),
+        sources=[
             {
                 "name": sr.source_name,
                 "success": sr.success,
@@ -127,26 +115,28 @@ def run(dry_run: bool = False) -> None:
             }
             for sr in all_source_results
         ],
-        "events": [
+        events=[
             {
                 "artist": e.artist,
                 "venue": e.venue,
-                "date": e.date.isoformat(),
+                "date": e.iso_date,
                 "time": e.time,
                 "source": e.source,
             }
             for e in deduped
         ],
-    }
+    )
 
-    with open(LOG_PATH, "w", encoding="utf-8") as f:
-        json.dump(log_data, f, indent=2)
+    _write_atomic(LOG_PATH, json_utils.dumps_pretty(run_log))
     print(f"  ✅ Wrote {LOG_PATH}")
 
     # Write build timestamp for upload page footer
     build_time_path = DOCS_DIR / "build_time.txt"
-    with open(build_time_path, "w", encoding="utf-8") as f:
-        f.write(run_timestamp.strftime("%B %-d, %Y at %-I:%M %p CT"))
+    build_time = (
+        f"{run_timestamp:%B} {run_timestamp.day}, {run_timestamp.year} "
+        f"at {format_time(run_timestamp, compact=False)} CT"
+    )
+    _write_atomic(build_time_path, build_time.encode("utf-8"))
     print(f"  ✅ Wrote {build_time_path}")
 
     # Summary
@@ -160,6 +150,49 @@ def run(dry_run: bool = False) -> None:
             print(f"     - {f.source_name}: {f.error_message}")
 
 
+def _fetch_source(source_name: str, module_path: str, fn_name: str) -> SourceResult:
+    """Import and run a single source's fetch function."""
+    try:
+        fetch_fn = getattr(importlib.import_module(module_path), fn_name)
+        return fetch_fn()
+    except Exception as e:
+        return SourceResult(
+            source_name=source_name,
+            success=False,
+            error_message=f"Unhandled exception: {str(e)[:100]}",
+        )
+
+
+def _fetch_venues() -> List[SourceResult]:
+    """Run the per-venue scrapers."""
+    try:
+        venue_scrapers = importlib.import_module(VENUE_SCRAPERS_MODULE)
+        return venue_scrapers.fetch_individual()
+    except Exception as e:
+        return [SourceResult(
+            source_name="Venue Websites",
+            success=False,
+            error_message=f"Unhandled exception: {str(e)[:100]}",
+        )]
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file via a temp file in the same directory and os.replace.
+
+    The rename is atomic, so a reader (e.g. GitHub Pages) never sees a
+    half-written page or log.
+    """
+    tmp = tempfile.NamedTemporaryFile("wb", dir=path.parent, delete=False)
+    try:
+        with tmp:
+            tmp.write(data)
+        os.chmod(tmp.name, 0o644)  # mkstemp creates 0600; match a normal write
+        os.replace(tmp.name, path)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+
+
 def _print_summary(events: List[Event]) -> None:
     """Print a text summary of events."""
     by_date = defaultdict(list)
@@ -171,8 +204,7 @@ def _print_summary(events: List[Event]) -> None:
     print(f"{'='*60}")
 
     for d in sorted(by_date.keys()):
-        day_name = d.strftime("%A, %B %-d").upper()
-        print(f"\n━━━ {day_name} ━━━")
+        print(f"\n━━━ {format_day_heading(d)} ━━━")
         for e in by_date[d]:
             print(f"  {e.display_line}")
 
@@ -3,23 +3,32 @@
 import re
 from dataclasses import dataclass, field
 from datetime import date, datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Event:
-    """A single music event."""
+    """A single music event (immutable and hashable)."""
     artist: str
     venue: str
     date: date
     time: Optional[str] = None  # e.g. "Doors 7 / Show 8" or "9 PM"
     source: str = ""  # Where we found this event
     url: Optional[str] = None  # Link to event page/tickets
+    # Derived once at construction; excluded from init, repr and comparison
+    iso_date: str = field(init=False, repr=False, compare=False)  # date.isoformat()
+    artist_lc: str = field(init=False, repr=False, compare=False)
+    venue_lc: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "iso_date", self.date.isoformat())
+        object.__setattr__(self, "artist_lc", self.artist.lower())
+        object.__setattr__(self, "venue_lc", self.venue.lower())
 
     @property
     def sort_key(self):
         """Sort by date, then venue, then artist."""
-        return (self.date, self.venue.lower(), self.artist.lower())
+        return (self.date, self.venue_lc, self.artist_lc)
 
     @property
     def display_line(self) -> str:
@@ -31,7 +40,7 @@ class Event:
 
     def normalized_key(self) -> str:
         """Key for deduplication: lowercase artist+venue+date."""
-        return f"{_normalize(self.artist)}|{_normalize(self.venue)}|{self.date.isoformat()}"
+        return f"{_normalize(self.artist)}|{_normalize(self.venue)}|{self.iso_date}"
 
 
 @dataclass
@@ -63,12 +72,33 @@ class SourceResult:
         return msg
 
 
+@dataclass(slots=True, frozen=True)
+class RunLog:
+    """Summary of a pipeline run, serialized as-is to docs/log.json."""
+    run_timestamp: datetime
+    date_range: Dict[str, date]
+    total_raw_events: int
+    total_deduped_events: int
+    sources: List[dict]
+    events: List[dict]
+
+
+_THE_PREFIX_RE = re.compile(r'^the\s+')
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_WS_RE = re.compile(r'\s+')
+# The ASCII characters _PUNCT_RE deletes (neither \w nor \s), as a
+# str.translate table for the dedup fast path in normalize._normalize
+_ASCII_PUNCT_TABLE = str.maketrans("", "", "".join(
+    c for c in map(chr, range(128)) if not (c.isalnum() or c == "_" or c.isspace())
+))
+
+
 def _normalize(text: str) -> str:
     """Normalize text for comparison: lowercase, strip common prefixes, punctuation."""
     text = text.lower().strip()
     # Remove "the " prefix
-    text = re.sub(r'^the\s+', '', text)
+    text = _THE_PREFIX_RE.sub('', text)
     # Remove punctuation and extra whitespace
-    text = re.sub(r'[^\w\s]', '', text)
-    text = re.sub(r'\s+', ' ', text)
+    text = _PUNCT_RE.sub('', text)
+    text = _WS_RE.sub(' ', text)
     return text.strip()
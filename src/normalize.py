@@ -5,8 +5,14 @@ Uses string similarity rather than Claude API — keeps costs at $0.
 """
 
 import re
-from typing import Dict, List
-from .models import Event
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Tuple
+from .models import Event, _ASCII_PUNCT_TABLE, _PUNCT_RE, _THE_PREFIX_RE, _WS_RE
+
+_SUFFIX_RE = re.compile(r'\s*(live|concert|tour|show|presents?|featuring|feat\.?|ft\.?)\s*$')
+
+# Sources whose listings tend to be the most accurate
+PREFERRED_SOURCES = ("Ticketmaster", "Venue:")
 
 
 def deduplicate(events: List[Event]) -> List[Event]:
@@ -18,10 +24,13 @@ def deduplicate(events: List[Event]) -> List[Event]:
     if not events:
         return []
 
+    # Drop exact repeats (same event from overlapping pages/URLs) up front
+    events = list(dict.fromkeys(events))
+
     # Group by date + venue
     groups: Dict[str, List[Event]] = {}
     for event in events:
-        key = f"{event.date.isoformat()}|{_normalize(event.venue)}"
+        key = f"{event.iso_date}|{_normalize(event.venue)}"
         groups.setdefault(key, []).append(event)
 
     deduped = []
@@ -30,30 +39,42 @@ def deduplicate(events: List[Event]) -> List[Event]:
             deduped.append(group_events[0])
             continue
 
-        # Within same date+venue, check for artist name matches
+        # Within same date+venue, check for artist name matches. Each kept
+        # event carries its normalized name, word set and detail score so
+        # they're computed once per event rather than once per comparison.
         seen_artists = []
         for event in group_events:
-            is_dup = False
+            candidate = _artist_entry(event)
             for i, seen in enumerate(seen_artists):
-                if _artists_match(event.artist, seen.artist):
-                    # Keep the more detailed one
-                    seen_artists[i] = _pick_best(seen, event)
-                    is_dup = True
+                if _artists_match(candidate, seen):
+                    # Keep the more detailed one (the earlier one on a tie)
+                    if candidate[3] > seen[3]:
+                        seen_artists[i] = candidate
                     break
-            if not is_dup:
-                seen_artists.append(event)
+            else:
+                seen_artists.append(candidate)
 
-        deduped.extend(seen_artists)
+        deduped.extend(entry[0] for entry in seen_artists)
 
     # Sort by date, then venue, then artist
     deduped.sort(key=lambda e: e.sort_key)
     return deduped
 
 
-def _artists_match(a: str, b: str) -> bool:
-    """Check if two artist names are likely the same act."""
-    na = _normalize(a)
-    nb = _normalize(b)
+# (event, normalized artist, artist word set, detail score)
+_ArtistEntry = Tuple[Event, str, FrozenSet[str], int]
+
+
+def _artist_entry(event: Event) -> _ArtistEntry:
+    """Precompute what the dedup inner loop compares for an event."""
+    name = _normalize(event.artist)
+    return event, name, frozenset(name.split()), _detail_score(event)
+
+
+def _artists_match(a: _ArtistEntry, b: _ArtistEntry) -> bool:
+    """Check if two artists (as _artist_entry tuples) are likely the same act."""
+    _, na, words_a, _ = a
+    _, nb, words_b, _ = b
 
     # Exact match after normalization
     if na == nb:
@@ -64,8 +85,6 @@ def _artists_match(a: str, b: str) -> bool:
         return True
 
     # High overlap of words (handles word order differences)
-    words_a = set(na.split())
-    words_b = set(nb.split())
     if not words_a or not words_b:
         return False
 
@@ -80,27 +99,27 @@ def _artists_match(a: str, b: str) -> bool:
     return False
 
 
+@lru_cache(maxsize=4096)
 def _normalize(text: str) -> str:
-    """Normalize text for comparison."""
+    """Normalize text for comparison.
+
+    Cached: venue names (and many artist names) repeat across sources, and
+    the dedup grouping re-normalizes the same venue for every event.
+    """
     text = text.lower().strip()
     # Remove "the " prefix
-    text = re.sub(r'^the\s+', '', text)
+    text = _THE_PREFIX_RE.sub('', text)
     # Remove common suffixes
-    text = re.sub(r'\s*(live|concert|tour|show|presents?|featuring|feat\.?|ft\.?)\s*$', '', text)
-    # Remove punctuation
-    text = re.sub(r'[^\w\s]', '', text)
-    # Collapse whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = _SUFFIX_RE.sub('', text)
+    # Remove punctuation and collapse whitespace
+    if text.isascii():
+        # Translate table matches _PUNCT_RE on ASCII; no regex engine needed
+        return " ".join(text.translate(_ASCII_PUNCT_TABLE).split())
+    text = _PUNCT_RE.sub('', text)
+    text = _WS_RE.sub(' ', text).strip()
     return text
 
 
-def _pick_best(a: Event, b: Event) -> Event:
-    """Pick the event with more detail."""
-    score_a = _detail_score(a)
-    score_b = _detail_score(b)
-    return a if score_a >= score_b else b
-
-
 def _detail_score(event: Event) -> int:
     """Score how much detail an event has."""
     score = 0
@@ -110,8 +129,11 @@ def _detail_score(event: Event) -> int:
         score += 1
     if len(event.artist) > 20:
         score += 1  # Longer names often have more context
-    # Prefer certain sources
-    preferred = ["Ticketmaster", "Venue:"]
-    if any(p in event.source for p in preferred):
-        score += 1
+    score += _source_bonus(event.source)
     return score
+
+
+@lru_cache(maxsize=64)
+def _source_bonus(source: str) -> int:
+    """Score bonus for preferred sources (cached — only a handful of distinct sources)."""
+    return 1 if any(p in source for p in PREFERRED_SOURCES) else 0
@@ -14,10 +14,12 @@ artifacts/
 
 from typing import Optional, List, Tuple
 import base64
-import email
 import io
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
+from email.parser import BytesParser
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
@@ -36,14 +38,22 @@ except ImportError:
     PILLOW_AVAILABLE = False
 
 from ..models import Event, SourceResult
+from .. import json_utils
 from ..config import START_DATE, END_DATE, normalize_venue_name
-from ..date_utils import parse_date_text
+from ..date_utils import format_time, parse_date_text
+from ..html_utils import HTML_PARSER, looks_like_event_jsonld
 
 SOURCE_NAME = "Artifacts (Vision-Extracted)"
 ARTIFACTS_DIR = Path(__file__).parent.parent.parent / "artifacts"
 
+_MONTH_ABBR_RE = re.compile(r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d')
+
 IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".webp"}
 WEBPAGE_EXTENSIONS = {".mhtml", ".html", ".htm"}
+SUPPORTED_EXTENSIONS = IMAGE_EXTENSIONS | WEBPAGE_EXTENSIONS
+
+# Concurrent artifact files; kept low to stay clear of vision API rate limits
+MAX_WORKERS = 5
 
 
 def fetch() -> SourceResult:
@@ -54,40 +64,41 @@ def fetch() -> SourceResult:
         result.error_message = "No artifacts/ folder found"
         return result
 
-    # Find all supported files
-    artifact_files = []
-    for ext in IMAGE_EXTENSIONS | WEBPAGE_EXTENSIONS:
-        artifact_files.extend(ARTIFACTS_DIR.glob(f"*{ext}"))
-        artifact_files.extend(ARTIFACTS_DIR.glob(f"*{ext.upper()}"))
-
-    # Deduplicate (glob with upper/lower could overlap)
-    artifact_files = sorted(set(artifact_files))
+    # Find all supported files in one directory pass (extension match is
+    # case-insensitive)
+    artifact_files = sorted(
+        path for path in ARTIFACTS_DIR.iterdir()
+        if path.suffix.lower() in SUPPORTED_EXTENSIONS and path.is_file()
+    )
 
     if not artifact_files:
         result.error_message = "No artifacts found"
         return result
 
-    for file_path in artifact_files:
-        try:
-            suffix = file_path.suffix.lower()
-            if suffix in WEBPAGE_EXTENSIONS:
-                events = _extract_events_from_webpage(file_path)
-            else:
-                events = _extract_events_from_image(file_path)
-
+    # Vision calls are one network round trip per image, so process files
+    # concurrently; results are merged back in file order.
+    with ThreadPoolExecutor(max_workers=min(len(artifact_files), MAX_WORKERS)) as pool:
+        for events in pool.map(_extract_events, artifact_files):
             result.events_found += len(events)
 
             for event in events:
                 if START_DATE <= event.date <= END_DATE:
                     result.events.append(event)
 
-        except Exception as e:
-            print(f"  Error processing {file_path.name}: {str(e)[:80]}")
-            continue
-
     return result
 
 
+def _extract_events(file_path: Path) -> List[Event]:
+    """Extract events from one artifact file, logging (not raising) errors."""
+    try:
+        if file_path.suffix.lower() in WEBPAGE_EXTENSIONS:
+            return _extract_events_from_webpage(file_path)
+        return _extract_events_from_image(file_path)
+    except Exception as e:
+        print(f"  Error processing {file_path.name}: {str(e)[:80]}")
+        return []
+
+
 # ---------------------------------------------------------------------------
 # Web page parsing (MHTML / HTML) — free, no API calls
 # ---------------------------------------------------------------------------
@@ -104,7 +115,7 @@ def _extract_events_from_webpage(file_path: Path) -> List[Event]:
     if not html:
         return []
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER)
 
     # Try site-specific parsers first, then generic
     events = _parse_bandsintown_html(soup, file_path)
@@ -116,9 +127,13 @@ def _extract_events_from_webpage(file_path: Path) -> List[Event]:
 
 
 def _read_mhtml(file_path: Path) -> str:
-    """Extract the HTML content from an MHTML (web archive) file."""
+    """Extract the HTML content from an MHTML (web archive) file.
+
+    The archive is fed to the parser straight from the file object rather
+    than read into one bytes blob first.
+    """
     with open(file_path, "rb") as f:
-        msg = email.message_from_bytes(f.read())
+        msg = BytesParser().parse(f)
 
     for part in msg.walk():
         if part.get_content_type() == "text/html":
@@ -135,7 +150,8 @@ def _parse_bandsintown_html(soup: BeautifulSoup, source_path: Path) -> List[Even
     Bandsintown event cards are <a> tags linking to /e/ with child divs
     containing artist name, venue/event title, and date/time.
     """
-    event_links = soup.find_all("a", href=lambda h: h and "/e/" in str(h))
+    # One CSS attribute-substring match instead of a Python callback per <a>
+    event_links = soup.select('a[href*="/e/"]')
     if not event_links:
         return []
 
@@ -198,7 +214,7 @@ def _parse_bandsintown_html(soup: BeautifulSoup, source_path: Path) -> List[Even
                 # Date is in a later block (contains month abbreviation and time)
                 date_text = ""
                 for block in text_blocks:
-                    if re.search(r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d', block):
+                    if _MONTH_ABBR_RE.search(block):
                         date_text = block
                         break
 
@@ -252,9 +268,14 @@ def _parse_generic_event_html(soup: BeautifulSoup, source_path: Path) -> List[Ev
 
     # Strategy 1: JSON-LD structured data
     for script in soup.find_all("script", type="application/ld+json"):
+        if not looks_like_event_jsonld(script.string or ""):
+            continue
         try:
-            data = json.loads(script.string)
-            items = data if isinstance(data, list) else [data]
+            data = json_utils.loads(str(script.string))  # orjson rejects str subclasses
+            if isinstance(data, dict) and "@graph" in data:
+                items = data["@graph"]
+            else:
+                items = data if isinstance(data, list) else [data]
             for item in items:
                 if item.get("@type") in ("Event", "MusicEvent"):
                     event = _parse_jsonld_event(item, source_path)
@@ -326,7 +347,7 @@ def _parse_jsonld_event(data: dict, source_path: Path) -> Optional[Event]:
     try:
         dt = datetime.fromisoformat(start_date.replace("Z", "+00:00"))
         event_date = dt.date()
-        time_str = dt.strftime("%-I:%M %p").replace(":00 ", " ")
+        time_str = format_time(dt)
     except ValueError:
         return None
 
@@ -358,7 +379,7 @@ def _extract_events_from_image(image_path: Path) -> List[Event]:
     image_bytes, media_type = _optimize_image(image_path)
     image_data = base64.standard_b64encode(image_bytes).decode("utf-8")
 
-    client = anthropic.Anthropic()
+    client = _anthropic_client()
 
     prompt = f"""Analyze this image and extract music/concert events for the week of {START_DATE} to {END_DATE}.
 
@@ -413,9 +434,9 @@ Extract all visible events for the target week, even if text is small."""
         start = response_text.find("[")
         end = response_text.rfind("]") + 1
         if start >= 0 and end > start:
-            events_data = json.loads(response_text[start:end])
+            events_data = json_utils.loads(response_text[start:end])
         else:
-            events_data = json.loads(response_text)
+            events_data = json_utils.loads(response_text)
     except json.JSONDecodeError as e:
         print(f"  Could not parse JSON from response: {response_text[:100]}")
         print(f"  Error: {str(e)[:80]}")
@@ -433,6 +454,12 @@ Extract all visible events for the target week, even if text is small."""
     return events
 
 
+@lru_cache(maxsize=None)
+def _anthropic_client():
+    """One shared (thread-safe) API client, so its connection pool is reused."""
+    return anthropic.Anthropic()
+
+
 def _parse_vision_event(data: dict, source_image: Path) -> Optional[Event]:
     """Convert Claude vision extracted event data to Event object."""
     artist = data.get("artist", "").strip()
@@ -10,21 +10,21 @@ scraping difficult. This source is currently disabled but kept for reference.
 from typing import List, Optional
 import requests
 from datetime import datetime, date
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 from ..models import Event, SourceResult
 from ..config import (
     START_DATE, END_DATE,
     normalize_venue_name, is_music_event,
 )
 from ..date_utils import parse_date_text
+from ..http_utils import SESSION
 
 SOURCE_NAME = "Bandsintown"
 CITY_URL = "https://www.bandsintown.com/c/memphis-tn"
 
-HEADERS = {
-    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                  "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-}
+# At least one of these must appear in the raw page for _parse_page to find
+# any cards; checked before paying for a full HTML parse.
+EVENT_MARKERS = ("event-card", "eventCard", "EventCard", "/e/")
 
 
 def fetch() -> SourceResult:
@@ -32,11 +32,14 @@ def fetch() -> SourceResult:
     result = SourceResult(source_name=SOURCE_NAME)
 
     try:
-        response = requests.get(CITY_URL, headers=HEADERS, timeout=15)
+        response = SESSION.get(CITY_URL, timeout=15)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        events = _parse_page(soup)
+        html = response.text
+        if any(marker in html for marker in EVENT_MARKERS):
+            events = _parse_page(_parse_html(html))
+        else:
+            events = []
 
         result.events_found = len(events)
         for event in events:
@@ -62,7 +65,12 @@ def fetch() -> SourceResult:
     return result
 
 
-def _parse_page(soup: BeautifulSoup) -> List[Event]:
+def _parse_html(text: str) -> LexborHTMLParser:
+    """Parse a page with selectolax's Lexbor engine (C parser and selectors)."""
+    return LexborHTMLParser(text)
+
+
+def _parse_page(tree: LexborHTMLParser) -> List[Event]:
     """Attempt to parse Bandsintown Memphis page.
 
     Note: Bandsintown's event data is loaded via JavaScript API calls,
@@ -72,32 +80,32 @@ def _parse_page(soup: BeautifulSoup) -> List[Event]:
 
     # Look for event cards — BIT uses various class patterns
     # Try common selectors; update as needed when site changes
-    event_cards = soup.select("[data-testid='event-card']")
+    event_cards = tree.css("[data-testid='event-card']")
     if not event_cards:
-        event_cards = soup.select(".event-card, .eventCard, [class*='EventCard']")
+        event_cards = tree.css(".event-card, .eventCard, [class*='EventCard']")
     if not event_cards:
         # Fallback: look for any links with date-like patterns
-        event_cards = soup.find_all("a", href=lambda h: h and "/e/" in str(h))
+        event_cards = tree.css("a[href*='/e/']")
 
     for card in event_cards:
         try:
             # Extract artist name
-            artist_el = card.select_one(
+            artist_el = card.css_first(
                 "[class*='artist'], [class*='Artist'], [data-testid='event-name'], h3, h4"
             )
-            artist = artist_el.get_text(strip=True) if artist_el else ""
+            artist = artist_el.text(strip=True) if artist_el else ""
 
             # Extract venue
-            venue_el = card.select_one(
+            venue_el = card.css_first(
                 "[class*='venue'], [class*='Venue'], [class*='location']"
             )
-            venue = venue_el.get_text(strip=True) if venue_el else ""
+            venue = venue_el.text(strip=True) if venue_el else ""
 
             # Extract date
-            date_el = card.select_one(
+            date_el = card.css_first(
                 "[class*='date'], [class*='Date'], time"
             )
-            date_text = date_el.get_text(strip=True) if date_el else ""
+            date_text = date_el.text(strip=True) if date_el else ""
 
             if not artist or not date_text:
                 continue
@@ -111,7 +119,10 @@ def _parse_page(soup: BeautifulSoup) -> List[Event]:
 
             # Get link
             url = None
-            link = card.get("href") or (card.find("a") or {}).get("href")
+            link = card.attributes.get("href")
+            if not link:
+                inner = card.css_first("a")
+                link = inner.attributes.get("href") if inner else None
             if link and not link.startswith("http"):
                 link = f"https://www.bandsintown.com{link}"
             url = link
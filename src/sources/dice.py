@@ -4,26 +4,39 @@ Scrapes the DICE Memphis browse page.
 URL: https://dice.fm/browse/Memphis:35.149844:-90.049566
 """
 
-from typing import List, Optional
+from typing import Iterator, List, Optional
 import requests
 import json
 import re
 from datetime import datetime
-from bs4 import BeautifulSoup
+from lxml import etree, html
 from ..models import Event, SourceResult
+from .. import json_utils
 from ..config import (
     START_DATE, END_DATE,
     normalize_venue_name, is_music_event,
 )
-from ..date_utils import parse_date_text
+from ..date_utils import format_time, parse_date_text
+from ..html_utils import iter_event_jsonld_blocks, node_text, xpath_first
+from ..http_utils import SESSION
 
 SOURCE_NAME = "DICE"
 BROWSE_URL = "https://dice.fm/browse/Memphis:35.149844:-90.049566"
 
-HEADERS = {
-    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                  "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-}
+_NEXT_DATA_RE = re.compile(r'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL)
+
+# DOM-fallback lookups as compiled XPath: the class substring tests over
+# every element run inside libxml2 instead of per-element Python checks
+_CARDS_XPATH = etree.XPath(
+    "//*[contains(@class, 'event') or contains(@class, 'Event')"
+    " or contains(@data-testid, 'event')]"
+)
+_CARD_TITLE = etree.XPath(
+    "(.//h2 | .//h3 | .//h4 | .//*[contains(@class, 'title') or contains(@class, 'name')])[1]"
+)
+_CARD_VENUE = etree.XPath("(.//*[contains(@class, 'venue') or contains(@class, 'location')])[1]")
+_CARD_DATE = etree.XPath("(.//*[self::time or contains(@class, 'date') or @datetime])[1]")
+_CARD_LINK = etree.XPath("(.//a)[1]")
 
 
 def fetch() -> SourceResult:
@@ -31,11 +44,10 @@ def fetch() -> SourceResult:
     result = SourceResult(source_name=SOURCE_NAME)
 
     try:
-        response = requests.get(BROWSE_URL, headers=HEADERS, timeout=15)
+        response = SESSION.get(BROWSE_URL, timeout=15)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        events = _parse_page(soup, response.text)
+        events = _parse_page(response.text)
 
         result.events_found = len(events)
         for event in events:
@@ -60,14 +72,18 @@ def fetch() -> SourceResult:
     return result
 
 
-def _parse_page(soup: BeautifulSoup, raw_html: str) -> List[Event]:
-    """Parse DICE browse page. Try JSON-LD first, then DOM parsing."""
+def _parse_page(raw_html: str) -> List[Event]:
+    """Parse DICE browse page. Try JSON-LD first, then DOM parsing.
+
+    The DOM is only built for the last-resort fallback; the structured-data
+    strategies work on the raw HTML.
+    """
     events = []
 
     # Strategy 1: Look for JSON-LD structured data
-    for script in soup.find_all("script", type="application/ld+json"):
+    for block in iter_event_jsonld_blocks(raw_html):
         try:
-            data = json.loads(script.string)
+            data = json_utils.loads(block)
             if isinstance(data, list):
                 for item in data:
                     event = _parse_jsonld(item)
@@ -84,10 +100,10 @@ def _parse_page(soup: BeautifulSoup, raw_html: str) -> List[Event]:
         return events
 
     # Strategy 2: Look for __NEXT_DATA__ or similar embedded JSON
-    next_data_match = re.search(r'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>', raw_html, re.DOTALL)
+    next_data_match = _NEXT_DATA_RE.search(raw_html)
     if next_data_match:
         try:
-            next_data = json.loads(next_data_match.group(1))
+            next_data = json_utils.loads(next_data_match.group(1))
             events = _parse_next_data(next_data)
             if events:
                 return events
@@ -95,33 +111,33 @@ def _parse_page(soup: BeautifulSoup, raw_html: str) -> List[Event]:
             pass
 
     # Strategy 3: DOM parsing fallback
-    event_cards = soup.select("[class*='event'], [class*='Event'], [data-testid*='event']")
-    for card in event_cards:
+    try:
+        doc = html.fromstring(raw_html)
+    except (etree.ParserError, ValueError):
+        return events
+    for card in _CARDS_XPATH(doc):
         try:
-            title_el = card.select_one("h2, h3, h4, [class*='title'], [class*='name']")
-            venue_el = card.select_one("[class*='venue'], [class*='location']")
-            date_el = card.select_one("time, [class*='date'], [datetime]")
-
-            title = title_el.get_text(strip=True) if title_el else ""
-            venue = venue_el.get_text(strip=True) if venue_el else ""
+            title = node_text(xpath_first(_CARD_TITLE, card))
+            venue = node_text(xpath_first(_CARD_VENUE, card))
+            date_el = xpath_first(_CARD_DATE, card)
 
             if not title:
                 continue
 
             # Try parsing date
             event_date = None
-            if date_el:
+            if date_el is not None:
                 datetime_attr = date_el.get("datetime")
                 if datetime_attr:
                     event_date = datetime.fromisoformat(datetime_attr.replace("Z", "+00:00")).date()
                 else:
-                    event_date = parse_date_text(date_el.get_text(strip=True))
+                    event_date = parse_date_text(node_text(date_el))
 
             if not event_date:
                 continue
 
-            link = card.find("a")
-            url = link.get("href", "") if link else ""
+            link = xpath_first(_CARD_LINK, card)
+            url = link.get("href", "") if link is not None else ""
             if url and not url.startswith("http"):
                 url = f"https://dice.fm{url}"
 
@@ -154,7 +170,7 @@ def _parse_jsonld(data: dict) -> Optional[Event]:
     try:
         dt = datetime.fromisoformat(start_date.replace("Z", "+00:00"))
         event_date = dt.date()
-        time_str = dt.strftime("%-I:%M %p").replace(":00 ", " ")
+        time_str = format_time(dt)
     except ValueError:
         return None
 
@@ -177,22 +193,21 @@ def _parse_jsonld(data: dict) -> Optional[Event]:
 
 def _parse_next_data(data: dict) -> List[Event]:
     """Try to extract events from Next.js page data."""
-    events = []
-
-    def _walk(obj, depth=0):
-        if depth > 10:
-            return
-        if isinstance(obj, dict):
-            # Look for event-like objects
-            if "name" in obj and ("startDate" in obj or "date" in obj):
-                event = _parse_jsonld(obj)
-                if event:
-                    events.append(event)
-            for v in obj.values():
-                _walk(v, depth + 1)
-        elif isinstance(obj, list):
-            for item in obj:
-                _walk(item, depth + 1)
-
-    _walk(data)
-    return events
+    return list(_iter_next_data_events(data))
+
+
+def _iter_next_data_events(obj, depth: int = 0) -> Iterator[Event]:
+    """Walk Next.js page data, yielding events as event-like objects are found."""
+    if depth > 10:
+        return
+    if isinstance(obj, dict):
+        # Look for event-like objects
+        if "name" in obj and ("startDate" in obj or "date" in obj):
+            event = _parse_jsonld(obj)
+            if event:
+                yield event
+        for v in obj.values():
+            yield from _iter_next_data_events(v, depth + 1)
+    elif isinstance(obj, list):
+        for item in obj:
+            yield from _iter_next_data_events(item, depth + 1)
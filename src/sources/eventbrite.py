@@ -8,6 +8,9 @@ from typing import Optional
 import requests
 from datetime import datetime
 from ..models import Event, SourceResult
+from .. import json_utils
+from ..date_utils import format_time
+from ..http_utils import SESSION
 import os
 from ..config import (
     START_DATE, END_DATE,
@@ -43,9 +46,9 @@ def fetch() -> SourceResult:
             "sort_by": "date",
         }
 
-        response = requests.get(BASE_URL, headers=headers, params=params, timeout=15)
+        response = SESSION.get(BASE_URL, headers=headers, params=params, timeout=15)
         response.raise_for_status()
-        data = response.json()
+        data = json_utils.loads(response.content)
 
         raw_events = data.get("events", [])
         result.events_found = len(raw_events)
@@ -89,7 +92,7 @@ def _parse_event(data: dict) -> Optional[Event]:
     event_date = dt.date()
 
     # Parse time
-    time_str = dt.strftime("%-I:%M %p").replace(":00 ", " ")
+    time_str = format_time(dt)
 
     # Parse venue
     venue_data = data.get("venue", {})
@@ -14,18 +14,38 @@ The sheet is your catch-all for:
 - Anything the automated scrapers miss
 """
 
-from typing import Optional
+from typing import Dict, List, Optional
 import csv
 import io
 import requests
-from datetime import datetime
+from datetime import date
+from functools import lru_cache
 from pathlib import Path
 from ..models import Event, SourceResult
+from ..date_utils import strptime_first
+from ..http_utils import SESSION
 from ..config import GOOGLE_SHEET_CSV_URL, START_DATE, END_DATE, normalize_venue_name
 
 SOURCE_NAME = "Manual (Google Sheet)"
 LOCAL_CSV_PATH = Path(__file__).parent.parent.parent / "manual_events.csv"
 
+# Accepted date cell formats, tried in order
+DATE_FORMATS = (
+    "%m/%d/%Y", "%m/%d/%y", "%m-%d-%Y", "%m-%d-%y",
+    "%Y-%m-%d", "%B %d, %Y", "%b %d, %Y",
+    "%B %d", "%b %d",  # No year — assume current
+    "%m/%d",  # No year — assume current
+)
+
+# Accepted header names per field, in priority order (case-insensitive)
+FIELD_NAMES = {
+    "date": ["date", "event_date", "event date"],
+    "artist": ["artist", "event", "act", "name", "artist/event"],
+    "venue": ["venue", "location", "place"],
+    "time": ["time", "showtime", "doors", "show time"],
+    "source_note": ["source_note", "source", "notes", "note"],
+}
+
 
 def fetch() -> SourceResult:
     """Fetch events from published Google Sheet, falling back to local CSV."""
@@ -36,7 +56,7 @@ def fetch() -> SourceResult:
     # Try Google Sheet URL first
     if GOOGLE_SHEET_CSV_URL:
         try:
-            response = requests.get(GOOGLE_SHEET_CSV_URL, timeout=10)
+            response = SESSION.get(GOOGLE_SHEET_CSV_URL, timeout=10)
             response.raise_for_status()
             csv_text = response.text
         except requests.exceptions.RequestException as e:
@@ -57,10 +77,11 @@ def fetch() -> SourceResult:
 
     try:
         reader = csv.DictReader(io.StringIO(csv_text))
-        
+        columns = _resolve_columns(reader.fieldnames or [])
+
         for row in reader:
             try:
-                event = _parse_row(row)
+                event = _parse_row(row, columns)
                 if event and START_DATE <= event.date <= END_DATE:
                     result.events.append(event)
                     result.events_found += 1
@@ -77,7 +98,23 @@ def fetch() -> SourceResult:
     return result
 
 
-def _parse_row(row: dict) -> Optional[Event]:
+def _resolve_columns(fieldnames: List[str]) -> Dict[str, Optional[str]]:
+    """Map each field to the CSV header that supplies it (None if absent).
+
+    Header names are matched flexibly (case and surrounding whitespace are
+    ignored) once per file rather than once per row.
+    """
+    by_name = {}
+    for key in fieldnames:
+        by_name.setdefault(key.strip().lower(), key)
+
+    columns = {}
+    for field, names in FIELD_NAMES.items():
+        columns[field] = next((by_name[n] for n in names if n in by_name), None)
+    return columns
+
+
+def _parse_row(row: dict, columns: Dict[str, Optional[str]]) -> Optional[Event]:
     """Parse a single row from the Google Sheet.
     
     Expected columns (case-insensitive, flexible naming):
@@ -87,41 +124,20 @@ def _parse_row(row: dict) -> Optional[Event]:
     - time: Optional time string
     - source_note: Optional note about source (e.g., "from Bar DKDC Instagram")
     """
-    # Find columns flexibly (handle different header capitalization)
-    def get_field(row, names):
-        for name in names:
-            for key in row:
-                if key.strip().lower() == name.lower():
-                    return row[key].strip()
-        return ""
-
-    date_str = get_field(row, ["date", "event_date", "event date"])
-    artist = get_field(row, ["artist", "event", "act", "name", "artist/event"])
-    venue = get_field(row, ["venue", "location", "place"])
-    time = get_field(row, ["time", "showtime", "doors", "show time"])
-    source_note = get_field(row, ["source_note", "source", "notes", "note"])
+    def get_field(field):
+        key = columns[field]
+        return (row.get(key) or "").strip() if key is not None else ""
+
+    date_str = get_field("date")
+    artist = get_field("artist")
+    venue = get_field("venue")
+    time = get_field("time")
+    source_note = get_field("source_note")
 
     if not date_str or not artist:
         return None
 
-    # Parse date — accept many formats
-    event_date = None
-    date_formats = [
-        "%m/%d/%Y", "%m/%d/%y", "%m-%d-%Y", "%m-%d-%y",
-        "%Y-%m-%d", "%B %d, %Y", "%b %d, %Y",
-        "%B %d", "%b %d",  # No year — assume current
-        "%m/%d",  # No year — assume current
-    ]
-    for fmt in date_formats:
-        try:
-            dt = datetime.strptime(date_str, fmt)
-            if dt.year < 2000:
-                dt = dt.replace(year=START_DATE.year)
-            event_date = dt.date()
-            break
-        except ValueError:
-            continue
-
+    event_date = _parse_sheet_date(date_str)
     if not event_date:
         return None
 
@@ -136,3 +152,17 @@ def _parse_row(row: dict) -> Optional[Event]:
         time=time if time else None,
         source=source,
     )
+
+
+@lru_cache(maxsize=2048)
+def _parse_sheet_date(date_str: str) -> Optional[date]:
+    """Parse a sheet date cell — accept many formats.
+
+    Cached: manual rows tend to share a handful of dates.
+    """
+    dt = strptime_first(date_str, DATE_FORMATS)
+    if not dt:
+        return None
+    if dt.year < 2000:
+        dt = dt.replace(year=START_DATE.year)
+    return dt.date()
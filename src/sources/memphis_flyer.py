@@ -5,15 +5,17 @@ URL: https://www.memphisflyer.com/memphis/EventSearch
 """
 
 from typing import List, Optional
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
-from bs4 import BeautifulSoup
+from lxml import etree, html
 from ..models import Event, SourceResult
 from ..config import (
     START_DATE, END_DATE,
     normalize_venue_name, is_music_event,
 )
 from ..date_utils import parse_date_text
+from ..html_utils import node_text, xpath_first
+from ..http_utils import SESSION
 
 SOURCE_NAME = "Memphis Flyer"
 # The Flyer calendar can be filtered by category — "Music" is usually category 1
@@ -24,36 +26,65 @@ CALENDAR_URLS = [
     "https://www.memphisflyer.com/search/event/music/",
 ]
 
-HEADERS = {
-    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                  "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-}
+
+def _has_class(name: str) -> str:
+    """XPath predicate equivalent to the CSS class selector `.name`."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Listing and field lookups, compiled once instead of re-translating CSS
+# selectors for every listing on every page.
+_LISTING_XPATHS = [
+    etree.XPath(
+        f"//*[{_has_class('EventListing')} or {_has_class('event-listing')}"
+        f" or contains(@class, 'event-item')] | //article[{_has_class('event')}]"
+    ),
+    etree.XPath(f"//*[{_has_class('fdn-listing-item')} or {_has_class('listing-item')}]"),
+    # Broader fallback
+    etree.XPath(
+        "//div[contains(translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', "
+        "'abcdefghijklmnopqrstuvwxyz'), 'event')]"
+    ),
+]
+_TITLE_LINK_XPATH = etree.XPath(
+    f"(.//h3//a | .//h2//a | .//*[{_has_class('fdn-listing-title')}]//a"
+    f" | .//*[{_has_class('event-title')}]//a | .//*[contains(@class, 'title')]//a)[1]"
+)
+_TITLE_XPATH = etree.XPath(f"(.//h3 | .//h2 | .//*[{_has_class('event-title')}])[1]")
+_VENUE_XPATH = etree.XPath(
+    f"(.//*[{_has_class('EventVenue')} or {_has_class('event-venue')}"
+    f" or contains(@class, 'venue') or contains(@class, 'location')])[1]"
+)
+_DATE_XPATH = etree.XPath(
+    f"(.//*[{_has_class('EventDate')} or {_has_class('event-date')}"
+    f" or contains(@class, 'date') or self::time])[1]"
+)
+_TIME_XPATH = etree.XPath(
+    f"(.//*[{_has_class('EventTime')} or {_has_class('event-time')}"
+    f" or contains(@class, 'time')])[1]"
+)
+_LINK_XPATH = etree.XPath("(.//a)[1]")
 
 
 def fetch() -> SourceResult:
     """Fetch music events from Memphis Flyer calendar."""
     result = SourceResult(source_name=SOURCE_NAME)
 
-    # Try each URL pattern until one works
-    for url in CALENDAR_URLS:
-        try:
-            response = requests.get(url, headers=HEADERS, timeout=15)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, "html.parser")
-                events = _parse_calendar(soup)
-                if events:
-                    result.events_found = len(events)
-                    for event in events:
-                        if is_music_event(event.artist, "music"):
-                            if START_DATE <= event.date <= END_DATE:
-                                result.events.append(event)
-                            else:
-                                result.events_filtered += 1
+    # Request every URL pattern at once (latency is the slowest fetch, not the
+    # sum) and use the first one, in priority order, that yields events
+    with ThreadPoolExecutor(max_workers=len(CALENDAR_URLS)) as pool:
+        for events in pool.map(_fetch_listings, CALENDAR_URLS):
+            if events:
+                result.events_found = len(events)
+                for event in events:
+                    if is_music_event(event.artist, "music"):
+                        if START_DATE <= event.date <= END_DATE:
+                            result.events.append(event)
                         else:
                             result.events_filtered += 1
-                    return result
-        except Exception:
-            continue
+                    else:
+                        result.events_filtered += 1
+                return result
 
     # If all URLs failed
     result.success = False
@@ -61,7 +92,21 @@ def fetch() -> SourceResult:
     return result
 
 
-def _parse_calendar(soup: BeautifulSoup) -> List[Event]:
+def _fetch_listings(url: str) -> List[Event]:
+    """Fetch and parse one calendar URL; any failure yields no events."""
+    try:
+        response = SESSION.get(url, timeout=15)
+        if response.status_code == 200:
+            # Hand lxml the raw bytes (no str copy); the header charset, when
+            # present, overrides its own sniffing just as response.text would
+            parser = html.HTMLParser(encoding=response.encoding)
+            return _parse_calendar(html.fromstring(response.content, parser=parser))
+    except Exception:
+        pass
+    return []
+
+
+def _parse_calendar(doc: html.HtmlElement) -> List[Event]:
     """Parse Memphis Flyer event listings.
     
     The Flyer uses Foundation CMS (Euclid Media). Common patterns:
@@ -71,41 +116,30 @@ def _parse_calendar(soup: BeautifulSoup) -> List[Event]:
     """
     events = []
 
-    # Try common Euclid Media / Foundation patterns
-    listings = soup.select(".EventListing, .event-listing, [class*='event-item'], article.event")
-    if not listings:
-        listings = soup.select(".fdn-listing-item, .listing-item")
-    if not listings:
-        # Broader fallback
-        listings = soup.find_all("div", class_=lambda c: c and "event" in c.lower()) if soup else []
+    # Try common Euclid Media / Foundation patterns, broadest last
+    listings = []
+    for listing_xpath in _LISTING_XPATHS:
+        listings = listing_xpath(doc)
+        if listings:
+            break
 
     for listing in listings:
         try:
             # Title
-            title_el = listing.select_one(
-                "h3 a, h2 a, .fdn-listing-title a, .event-title a, [class*='title'] a"
-            )
-            if not title_el:
-                title_el = listing.select_one("h3, h2, .event-title")
-            title = title_el.get_text(strip=True) if title_el else ""
+            title_el = xpath_first(_TITLE_LINK_XPATH, listing)
+            if title_el is None:
+                title_el = xpath_first(_TITLE_XPATH, listing)
+            title = node_text(title_el)
 
             # Venue
-            venue_el = listing.select_one(
-                ".EventVenue, .event-venue, [class*='venue'], [class*='location']"
-            )
-            venue = venue_el.get_text(strip=True) if venue_el else ""
+            venue = node_text(xpath_first(_VENUE_XPATH, listing))
 
             # Date
-            date_el = listing.select_one(
-                ".EventDate, .event-date, [class*='date'], time"
-            )
-            date_text = date_el.get_text(strip=True) if date_el else ""
+            date_text = node_text(xpath_first(_DATE_XPATH, listing))
 
             # Time
-            time_el = listing.select_one(
-                ".EventTime, .event-time, [class*='time']"
-            )
-            time_text = time_el.get_text(strip=True) if time_el else None
+            time_el = xpath_first(_TIME_XPATH, listing)
+            time_text = node_text(time_el) if time_el is not None else None
 
             if not title:
                 continue
@@ -116,11 +150,11 @@ def _parse_calendar(soup: BeautifulSoup) -> List[Event]:
 
             # URL
             url = None
-            if title_el and title_el.name == "a":
+            if title_el is not None and title_el.tag == "a":
                 url = title_el.get("href")
-            elif title_el:
-                link = title_el.find("a")
-                if link:
+            elif title_el is not None:
+                link = xpath_first(_LINK_XPATH, title_el)
+                if link is not None:
                     url = link.get("href")
             if url and not url.startswith("http"):
                 url = f"https://www.memphisflyer.com{url}"
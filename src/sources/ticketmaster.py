@@ -6,9 +6,13 @@ Get API key: https://developer-acct.ticketmaster.com/user/register
 """
 
 from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
 import requests
 from datetime import datetime
 from ..models import Event, SourceResult
+from .. import json_utils
+from ..date_utils import format_time
+from ..http_utils import SESSION
 from ..config import (
     TICKETMASTER_API_KEY, START_DATE, END_DATE,
     MEMPHIS_LAT, MEMPHIS_LON, MEMPHIS_RADIUS,
@@ -17,6 +21,11 @@ from ..config import (
 
 SOURCE_NAME = "Ticketmaster"
 BASE_URL = "https://app.ticketmaster.com/discovery/v2/events.json"
+PAGE_SIZE = 100
+# Discovery API deep-paging limit: size * page must stay under 1,000
+MAX_PAGES = 1000 // PAGE_SIZE
+# Stay under the API's 5 requests/second rate limit
+MAX_PAGE_WORKERS = 4
 
 
 def fetch() -> SourceResult:
@@ -37,19 +46,32 @@ def fetch() -> SourceResult:
             "classificationName": "music",
             "startDateTime": f"{START_DATE.isoformat()}T00:00:00Z",
             "endDateTime": f"{END_DATE.isoformat()}T23:59:59Z",
-            "size": 100,
+            "size": PAGE_SIZE,
             "sort": "date,asc",
         }
 
-        response = requests.get(BASE_URL, params=params, timeout=15)
-        response.raise_for_status()
-        data = response.json()
+        data = _fetch_page(params, 0)
 
         if "_embedded" not in data or "events" not in data["_embedded"]:
             result.events_found = 0
             return result
 
-        raw_events = data["_embedded"]["events"]
+        raw_events = list(data["_embedded"]["events"])
+
+        # Fetch any remaining pages concurrently
+        total_pages = min(data.get("page", {}).get("totalPages", 1), MAX_PAGES)
+        if total_pages > 1:
+            pages = range(1, total_pages)
+            skipped_pages = 0
+            with ThreadPoolExecutor(max_workers=min(len(pages), MAX_PAGE_WORKERS)) as pool:
+                for page_data in pool.map(lambda page: _fetch_extra_page(params, page), pages):
+                    if not page_data:
+                        skipped_pages += 1
+                        continue
+                    raw_events.extend(page_data.get("_embedded", {}).get("events", []))
+            if skipped_pages:
+                print(f"    Ticketmaster: skipped {skipped_pages} of {total_pages} page(s) after errors")
+
         result.events_found = len(raw_events)
 
         for event_data in raw_events:
@@ -72,6 +94,27 @@ def fetch() -> SourceResult:
     return result
 
 
+def _fetch_page(params: dict, page: int) -> dict:
+    """Fetch one page of search results."""
+    response = SESSION.get(BASE_URL, params={**params, "page": page}, timeout=15)
+    response.raise_for_status()
+    return json_utils.loads(response.content)
+
+
+def _fetch_extra_page(params: dict, page: int) -> dict:
+    """Fetch a page after the first, returning {} if it fails.
+
+    A failed extra page shouldn't discard the events already fetched, so
+    errors are logged here instead of failing the whole source.
+    """
+    try:
+        return _fetch_page(params, page)
+    except (requests.exceptions.RequestException, ValueError) as e:
+        # ValueError covers JSONDecodeError from a truncated/garbled body
+        print(f"    Ticketmaster page {page} failed: {str(e)[:80]}")
+        return {}
+
+
 def _parse_event(data: dict) -> Optional[Event]:
     """Parse a single Ticketmaster event into our Event model."""
     name = data.get("name", "").strip()
@@ -91,7 +134,7 @@ def _parse_event(data: dict) -> Optional[Event]:
     if local_time:
         try:
             t = datetime.strptime(local_time, "%H:%M:%S")
-            time_str = t.strftime("%-I:%M %p").replace(":00 ", " ")
+            time_str = format_time(t)
         except ValueError:
             pass
 
@@ -5,40 +5,65 @@ When a venue changes their site, you only fix that one function.
 """
 
 from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
 import requests
 import json
 import re
+import sys
 from datetime import datetime
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 from ..models import Event, SourceResult
+from .. import json_utils
 from ..config import (
     VENUES, START_DATE, END_DATE,
     normalize_venue_name, is_music_event,
 )
-from ..date_utils import parse_date_text
-
-HEADERS = {
-    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                  "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-}
+from ..date_utils import format_time, parse_date_text
+from ..html_utils import iter_event_jsonld_blocks
+from ..http_utils import SESSION
+
+# Per-card selectors
+# Generic parser: precise selectors only (avoid [class*=] which can match <body>)
+_GENERIC_TITLE = (
+    "h1 a, h2 a, h3 a, h1, h2, h3, "
+    ".tribe-events-list-event-title a, "
+    ".eventlist-title a, .eventlist-title-link, "
+    ".summary-title a"
+)
+_GENERIC_DATE = (
+    "time[datetime], .tribe-event-schedule-details abbr, "
+    ".eventlist-meta-date, "
+    ".summary-metadata-item--date"
+)
+# Specific start-time selectors before containers
+_GENERIC_TIMES = [
+    "time.event-time-localized-start",
+    ".tribe-event-time",
+    ".eventlist-meta-time",
+]
+_EVENT_LINK = "a[href*='/event/']"
+
+# Concurrent venue fetches. Each venue is its own host with one request, so
+# per-host pool size doesn't apply; 8 threads cover the ~11 scraped venues in
+# two waves while keeping the thread count modest next to the other sources.
+MAX_WORKERS = 8
+
+# Venues with a web calendar to scrape (manual-only venues skipped), fixed
+# at import since VENUES is static config
+SCRAPED_VENUES = tuple(
+    (venue_key, venue_info)
+    for venue_key, venue_info in VENUES.items()
+    if venue_info.get("calendar_url")
+    and venue_info.get("scraper", "generic") != "manual_only"
+)
 
 
 def fetch() -> SourceResult:
     """Fetch events from all configured venue websites."""
     result = SourceResult(source_name="Venue Websites")
-    sub_results = []
-
-    for venue_key, venue_info in VENUES.items():
-        url = venue_info.get("calendar_url")
-        scraper_type = venue_info.get("scraper", "generic")
-
-        # Skip venues without web calendars (manual-only)
-        if not url or scraper_type == "manual_only":
-            continue
-
-        venue_result = _scrape_venue(venue_key, venue_info)
-        sub_results.append(venue_result)
+    sub_results = fetch_individual()
 
+    for venue_result in sub_results:
         result.events_found += venue_result.events_found
         result.events.extend(venue_result.events)
         result.events_filtered += venue_result.events_filtered
@@ -58,20 +83,16 @@ def fetch() -> SourceResult:
 
 
 def fetch_individual() -> List[SourceResult]:
-    """Fetch events from each venue separately (for detailed logging)."""
-    results = []
-
-    for venue_key, venue_info in VENUES.items():
-        url = venue_info.get("calendar_url")
-        scraper_type = venue_info.get("scraper", "generic")
-
-        if not url or scraper_type == "manual_only":
-            continue
+    """Fetch events from each venue separately (for detailed logging).
 
-        venue_result = _scrape_venue(venue_key, venue_info)
-        results.append(venue_result)
+    Venues are scraped concurrently — the work is almost all network wait —
+    and results come back in VENUES order.
+    """
+    if not SCRAPED_VENUES:
+        return []
 
-    return results
+    with ThreadPoolExecutor(max_workers=min(len(SCRAPED_VENUES), MAX_WORKERS)) as pool:
+        return list(pool.map(lambda venue: _scrape_venue(*venue), SCRAPED_VENUES))
 
 
 def _scrape_venue(venue_key: str, venue_info: dict) -> SourceResult:
@@ -81,26 +102,25 @@ def _scrape_venue(venue_key: str, venue_info: dict) -> SourceResult:
     result = SourceResult(source_name=f"Venue: {name}")
 
     try:
-        response = requests.get(url, headers=HEADERS, timeout=15, allow_redirects=True)
+        response = SESSION.get(url, timeout=15, allow_redirects=True)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "html.parser")
         scraper_type = venue_info.get("scraper", "generic")
 
         # Custom scrapers for specific venues
         if scraper_type == "hi_tone":
-            events = _parse_hi_tone(soup, name)
+            events = _parse_hi_tone(_parse_html(response), name)
         elif scraper_type == "minglewood":
-            events = _parse_minglewood(soup, name)
+            events = _parse_minglewood(_parse_html(response), name)
         elif scraper_type == "hernandos":
-            events = _parse_hernandos(soup, name)
+            events = _parse_hernandos(_parse_html(response), name)
         else:
             # Try JSON-LD first (many event sites embed structured data)
-            events = _try_jsonld(soup, name)
+            events = _try_jsonld(response.text, name)
 
             # If no JSON-LD, try generic DOM parsing
             if not events:
-                events = _try_generic_parse(soup, name)
+                events = _try_generic_parse(_parse_html(response), name)
 
         result.events_found = len(events)
         for event in events:
@@ -122,13 +142,22 @@ def _scrape_venue(venue_key: str, venue_info: dict) -> SourceResult:
     return result
 
 
-def _try_jsonld(soup: BeautifulSoup, venue_name: str) -> List[Event]:
+def _parse_html(response: requests.Response) -> LexborHTMLParser:
+    """Parse a venue page with selectolax's Lexbor engine (C parser and selectors).
+
+    Parsed from response.text so the HTTP charset is honoured; Lexbor reads
+    raw bytes as UTF-8.
+    """
+    return LexborHTMLParser(response.text)
+
+
+def _try_jsonld(html: str, venue_name: str) -> List[Event]:
     """Extract events from JSON-LD structured data (Schema.org Event)."""
     events = []
 
-    for script in soup.find_all("script", type="application/ld+json"):
+    for block in iter_event_jsonld_blocks(html):
         try:
-            data = json.loads(script.string)
+            data = json_utils.loads(block)
             items = data if isinstance(data, list) else [data]
 
             for item in items:
@@ -165,7 +194,7 @@ def _jsonld_to_event(data: dict, default_venue: str) -> Optional[Event]:
         else:
             dt = datetime.strptime(start_date, "%Y-%m-%d")
         event_date = dt.date()
-        time_str = dt.strftime("%-I:%M %p").replace(":00 ", " ") if "T" in start_date else None
+        time_str = format_time(dt) if "T" in start_date else None
     except ValueError:
         return None
 
@@ -184,12 +213,12 @@ def _jsonld_to_event(data: dict, default_venue: str) -> Optional[Event]:
         venue=venue,
         date=event_date,
         time=time_str,
-        source=f"Venue: {default_venue}",
+        source=_source_label(default_venue),
         url=url,
     )
 
 
-def _try_generic_parse(soup: BeautifulSoup, venue_name: str) -> List[Event]:
+def _try_generic_parse(tree: LexborHTMLParser, venue_name: str) -> List[Event]:
     """Generic DOM parser — tries common event listing patterns.
     
     Many venue sites use WordPress with events plugins (The Events Calendar,
@@ -218,32 +247,23 @@ def _try_generic_parse(soup: BeautifulSoup, venue_name: str) -> List[Event]:
 
     listings = []
     for selector in selectors:
-        listings = soup.select(selector)
+        listings = tree.css(selector)
         if listings:
             break
 
     for listing in listings:
         try:
-            # Title — precise selectors only (avoid [class*=] which can match <body>)
-            title_el = listing.select_one(
-                "h1 a, h2 a, h3 a, h1, h2, h3, "
-                ".tribe-events-list-event-title a, "
-                ".eventlist-title a, .eventlist-title-link, "
-                ".summary-title a"
-            )
-            title = title_el.get_text(strip=True) if title_el else ""
-
-            # Date — precise selectors only
-            date_el = listing.select_one(
-                "time[datetime], .tribe-event-schedule-details abbr, "
-                ".eventlist-meta-date, "
-                ".summary-metadata-item--date"
-            )
+            # Title
+            title_el = listing.css_first(_GENERIC_TITLE)
+            title = title_el.text(strip=True) if title_el else ""
+
+            # Date
+            date_el = listing.css_first(_GENERIC_DATE)
 
             event_date = None
             if date_el:
                 # Try datetime attribute first
-                dt_attr = date_el.get("datetime")
+                dt_attr = date_el.attributes.get("datetime")
                 if dt_attr:
                     try:
                         event_date = datetime.fromisoformat(
@@ -253,23 +273,19 @@ def _try_generic_parse(soup: BeautifulSoup, venue_name: str) -> List[Event]:
                         pass
                 # Fall back to text parsing
                 if not event_date:
-                    event_date = parse_date_text(date_el.get_text(strip=True))
+                    event_date = parse_date_text(date_el.text(strip=True))
 
-            # Time — try specific start-time selectors before containers
-            time_el = (
-                listing.select_one("time.event-time-localized-start") or
-                listing.select_one(".tribe-event-time") or
-                listing.select_one(".eventlist-meta-time")
-            )
-            time_str = time_el.get_text(strip=True) if time_el else None
+            # Time
+            time_el = _select_first(_GENERIC_TIMES, listing)
+            time_str = time_el.text(strip=True) if time_el else None
 
             if not title or not event_date:
                 continue
 
             # URL
             url = None
-            if title_el and title_el.name == "a":
-                url = title_el.get("href")
+            if title_el and title_el.tag == "a":
+                url = title_el.attributes.get("href")
             if url and not url.startswith("http"):
                 url = None  # Skip relative URLs for now
 
@@ -278,7 +294,7 @@ def _try_generic_parse(soup: BeautifulSoup, venue_name: str) -> List[Event]:
                 venue=venue_name,
                 date=event_date,
                 time=time_str,
-                source=f"Venue: {venue_name}",
+                source=_source_label(venue_name),
                 url=url,
             ))
         except Exception:
@@ -287,33 +303,47 @@ def _try_generic_parse(soup: BeautifulSoup, venue_name: str) -> List[Event]:
     return events
 
 
-def _parse_hi_tone(soup: BeautifulSoup, venue_name: str) -> List[Event]:
+def _source_label(venue_name: str) -> str:
+    """Interned "Venue: <name>" so a venue's events all share one source string."""
+    return sys.intern(f"Venue: {venue_name}")
+
+
+def _select_first(selectors: List[str], node: LexborNode) -> Optional[LexborNode]:
+    """Return the first match of the first selector that matches under node."""
+    for selector in selectors:
+        el = node.css_first(selector)
+        if el is not None:
+            return el
+    return None
+
+
+def _parse_hi_tone(tree: LexborHTMLParser, venue_name: str) -> List[Event]:
     """Parse Hi Tone events from hitonecafe.com .eventWrapper cards."""
     events = []
 
-    for card in soup.select(".eventWrapper"):
+    for card in tree.css(".eventWrapper"):
         try:
-            date_el = card.select_one("[class*='eventMonth']")
-            title_el = card.select_one("h2, h3")
-            link_el = card.select_one("a[href*='/event/']")
+            date_el = card.css_first("[class*='eventMonth']")
+            title_el = card.css_first("h2, h3")
+            link_el = card.css_first(_EVENT_LINK)
 
             if not date_el or not title_el:
                 continue
 
-            title = title_el.get_text(strip=True)
-            date_text = date_el.get_text(strip=True)
+            title = title_el.text(strip=True)
+            date_text = date_el.text(strip=True)
 
             event_date = parse_date_text(date_text)
             if not event_date:
                 continue
 
-            url = link_el["href"] if link_el else None
+            url = link_el.attributes["href"] if link_el else None
 
             events.append(Event(
                 artist=title,
                 venue=venue_name,
                 date=event_date,
-                source=f"Venue: {venue_name}",
+                source=_source_label(venue_name),
                 url=url,
             ))
         except Exception:
@@ -322,33 +352,33 @@ def _parse_hi_tone(soup: BeautifulSoup, venue_name: str) -> List[Event]:
     return events
 
 
-def _parse_minglewood(soup: BeautifulSoup, venue_name: str) -> List[Event]:
+def _parse_minglewood(tree: LexborHTMLParser, venue_name: str) -> List[Event]:
     """Parse Minglewood Hall events from .tw-name / .tw-date-time cards."""
     events = []
 
-    for card in soup.select(".seven.columns"):
+    for card in tree.css(".seven.columns"):
         try:
-            name_el = card.select_one(".tw-name")
-            date_el = card.select_one(".tw-date-time")
-            link_el = card.select_one("a[href*='/event/']")
+            name_el = card.css_first(".tw-name")
+            date_el = card.css_first(".tw-date-time")
+            link_el = card.css_first(_EVENT_LINK)
 
             if not name_el or not date_el:
                 continue
 
-            title = name_el.get_text(strip=True)
-            date_text = date_el.get_text(strip=True)
+            title = name_el.text(strip=True)
+            date_text = date_el.text(strip=True)
 
             event_date = parse_date_text(date_text)
             if not event_date:
                 continue
 
-            url = link_el["href"] if link_el else None
+            url = link_el.attributes["href"] if link_el else None
 
             events.append(Event(
                 artist=title,
                 venue=venue_name,
                 date=event_date,
-                source=f"Venue: {venue_name}",
+                source=_source_label(venue_name),
                 url=url,
             ))
         except Exception:
@@ -357,36 +387,36 @@ def _parse_minglewood(soup: BeautifulSoup, venue_name: str) -> List[Event]:
     return events
 
 
-def _parse_hernandos(soup: BeautifulSoup, venue_name: str) -> List[Event]:
+def _parse_hernandos(tree: LexborHTMLParser, venue_name: str) -> List[Event]:
     """Parse Hernando's Hideaway events from .event-info-block cards."""
     events = []
 
-    for card in soup.select(".event-info-block"):
+    for card in tree.css(".event-info-block"):
         try:
-            title_el = card.select_one(".title a, .title")
-            date_el = card.select_one(".date")
-            time_el = card.select_one(".see-showtime")
-            link_el = card.select_one("a[href]")
+            title_el = card.css_first(".title a, .title")
+            date_el = card.css_first(".date")
+            time_el = card.css_first(".see-showtime")
+            link_el = card.css_first("a[href]")
 
             if not title_el or not date_el:
                 continue
 
-            title = title_el.get_text(strip=True)
-            date_text = date_el.get_text(strip=True)
+            title = title_el.text(strip=True)
+            date_text = date_el.text(strip=True)
 
             event_date = parse_date_text(date_text)
             if not event_date:
                 continue
 
-            time_str = time_el.get_text(strip=True) if time_el else None
-            url = link_el["href"] if link_el else None
+            time_str = time_el.text(strip=True) if time_el else None
+            url = link_el.attributes["href"] if link_el else None
 
             events.append(Event(
                 artist=title,
                 venue=venue_name,
                 date=event_date,
                 time=time_str,
-                source=f"Venue: {venue_name}",
+                source=_source_label(venue_name),
                 url=url,
             ))
         except Exception: